@@ -3,6 +3,8 @@ This module provides utilities for displaying colors and themes in a terminal,
 including 24-bit color support and standard ANSI escape codes.
 """
 
+from functools import lru_cache
+import sys
 from typing import Any
 
 
@@ -39,8 +41,13 @@ class AnsiColors:
         return f"\033[38;2;{r};{g};{b}m"
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def bg_rgb(r: int, g: int, b: int) -> str:
-        """Returns the escape sequence for a 24-bit RGB background color."""
+        """
+        Returns the escape sequence for a 24-bit RGB background color.
+
+        Results are cached, since previews print the same palette colors repeatedly.
+        """
         return f"\033[48;2;{r};{g};{b}m"
 
     @classmethod
@@ -50,22 +57,22 @@ class AnsiColors:
         return f"{style}{color}{text}{cls.RESET}"
 
 
-def show_terminal_colors() -> None:
-    """Displays the standard 16 ANSI terminal colors."""
-    print("\nTerminal Colors:")
+# The 16-color swatch never changes, so it is built once at import.
+_TERMINAL_COLORS_PREVIEW = (
+    "\nTerminal Colors:\n"
+    + "".join(f"\033[4{i}m    " for i in range(8))
+    + AnsiColors.RESET
+    + "\n"
+    + "".join(f"\033[10{i}m    " for i in range(8))
+    + AnsiColors.RESET
+    + "\n\n"
+)
 
-    # Normal/Dark variants
-    normal_variants = []
-    for i in range(8):
-        normal_variants.append(f"\033[4{i}m    ")
-    print("".join(normal_variants) + AnsiColors.RESET)
 
-    # Bright/Light variants
-    bright_variants = []
-    for i in range(8):
-        bright_variants.append(f"\033[10{i}m    ")
-    print("".join(bright_variants) + AnsiColors.RESET)
-    print()  # Empty line at end
+def show_terminal_colors() -> None:
+    """Displays the standard 16 ANSI terminal colors."""
+    sys.stdout.write(_TERMINAL_COLORS_PREVIEW)
+    sys.stdout.flush()
 
 
 def preview_theme(theme: dict[str, Any]) -> None:
@@ -91,31 +98,31 @@ def preview_theme(theme: dict[str, Any]) -> None:
         color_block = f"{bg_ansi}    {AnsiColors.RESET}"
         return f"{label:20} {color_block}  {rgb.hex}"
 
-    print()  # Empty line at start
+    lines = [""]  # Empty line at start
 
     # Main color pairs
     if "bg-primary" in theme and "text-primary" in theme:
-        print(
+        lines.append(
             format_pair_line(
                 "Primary Pair:", theme["bg-primary"], theme["text-primary"]
             )
         )
 
     if "bg-secondary" in theme and "text-secondary" in theme:
-        print(
+        lines.append(
             format_pair_line(
                 "Secondary Pair:", theme["bg-secondary"], theme["text-secondary"]
             )
         )
 
     if "bg-tertiary" in theme and "text-tertiary" in theme:
-        print(
+        lines.append(
             format_pair_line(
                 "Tertiary Pair:", theme["bg-tertiary"], theme["text-tertiary"]
             )
         )
 
-    print()  # Empty line separator
+    lines.append("")  # Empty line separator
 
     # Single colors
     single_colors = [
@@ -130,5 +137,9 @@ def preview_theme(theme: dict[str, Any]) -> None:
 
     for label, key in single_colors:
         if key in theme:
-            print(format_single_line(label, theme[key]))
-    print()  # Empty line at end
+            lines.append(format_single_line(label, theme[key]))
+    lines.append("")  # Empty line at end
+
+    # the whole preview goes out in a single write
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
@@ -77,10 +77,12 @@ def assign_color(
     )
     active_border, inactive_border = _assign_border(accent_primary, bg_primary)
 
-    logging.debug(
-        "Post Contrast Ratio: %.2f",
-        contrast_ratio(bg_primary.luma, fg_primary.luma),
-    )
+    # the ratio is computed only for this message, so skip it unless shown
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(
+            "Post Contrast Ratio: %.2f",
+            contrast_ratio(bg_primary.luma, fg_primary.luma),
+        )
 
     # --- Construct Final Theme Dictionary ---
     theme_dict = {
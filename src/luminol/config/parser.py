@@ -25,15 +25,21 @@ def load_config(config_file_path: str | Path) -> dict:
     """
     config_file_path = Path(config_file_path)
 
-    if not config_file_path.is_file():
+    # Read the whole file in one go and parse it from memory; a missing file
+    # is detected by the read itself rather than a separate stat.
+    try:
+        raw = config_file_path.read_bytes()
+    except (FileNotFoundError, IsADirectoryError):
         raise FileNotFoundError(
             f"No {config_file_path.name} found in {config_file_path.parent}"
-        )
+        ) from None
+    except OSError as e:
+        logging.error("Cannot read config file %s: %s", config_file_path, e)
+        raise SystemExit(1) from e
 
     try:
-        with open(config_file_path, "rb") as config:
-            config_toml_data: dict = tomllib.load(config)
-            logging.info("Config File Loaded")
+        config_toml_data: dict = tomllib.loads(raw.decode("utf-8"))
+        logging.info("Config File Loaded")
 
         return config_toml_data
 
@@ -41,10 +47,6 @@ def load_config(config_file_path: str | Path) -> dict:
         logging.error("Invalid TOML syntax in config: %s", e)
         raise SystemExit(1) from e
 
-    except OSError as e:
-        logging.error("Cannot read config file %s: %s", config_file_path, e)
-        raise SystemExit(1) from e
-
     except Exception as e:
         logging.error(
             "Unexpected error occurred while loading config from %s: %s",
@@ -55,7 +57,7 @@ def load_config(config_file_path: str | Path) -> dict:
 
 
 # NOTE: most of the class is generated by AI, needs review
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Settings for a single application, parsed from config."""
 
@@ -98,7 +100,7 @@ class AppSettings:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalSettings:
     """Global settings for Luminol."""
 
@@ -151,6 +153,8 @@ class Config:
         'hex8'
     """
 
+    __slots__ = ("global_settings", "apps")
+
     def __init__(self, config_data: dict):
         """
         Validate, initialize and parse the raw config data.
@@ -298,7 +298,7 @@ def _validate_remap_colors(options: dict, location: str) -> int:
         source = values.get("source")
         if not source:
             logging.error(
-                "No '%ssource%s' defined for color '%s%s%s' in %%s.colors%s.",
+                "No '%ssource%s' defined for color '%s%s%s' in %s%s.colors%s.",
                 ERR,
                 RESET,
                 INFO,
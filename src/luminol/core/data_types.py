@@ -54,7 +54,10 @@ Examples:
         1.0
 
 Notes:
-    - All color classes are immutable and support equality comparison
+    - All color classes are immutable NamedTuples and can be used as dict/set
+      keys. Equality and hashing are plain tuple comparisons and ignore the
+      type, so RGB(0, 0, 0) == HSL(0, 0, 0) == (0, 0, 0); do not mix color
+      spaces in one dict or set
     - RGB values must be integers in range [0, 255]
     - HSL/HSV values are floats in range [0.0, 1.0]
     - Alpha values are floats in range [0.0, 1.0]
@@ -63,12 +66,28 @@ Notes:
 """
 
 import colorsys
+from typing import NamedTuple
+
 from ..cli.term_colors import AnsiColors
 
 
 GAMMA = 2.4
 
 
+def _hue_to_rgb(h: float) -> tuple[float, float, float]:
+    """
+    Branchless fully saturated RGB (each channel in [0, 1]) for a hue in [0, 1).
+
+    Each channel is a clamped triangle wave of the hue, which avoids the
+    per-sector branching done by colorsys.
+    """
+    h6 = (h % 1.0) * 6.0
+    r = min(max(abs(h6 - 3.0) - 1.0, 0.0), 1.0)
+    g = min(max(2.0 - abs(h6 - 2.0), 0.0), 1.0)
+    b = min(max(2.0 - abs(h6 - 4.0), 0.0), 1.0)
+    return r, g, b
+
+
 def _to_linear(c: int) -> float:
     """Helper to convert a single color channel to linear space."""
     c_norm = c / 255.0
@@ -77,7 +96,29 @@ def _to_linear(c: int) -> float:
     return ((c_norm + 0.055) / 1.055) ** GAMMA
 
 
-class RGB:
+# Channels are 8-bit, so every linearized value is precomputed once.
+_LINEAR = tuple(_to_linear(c) for c in range(256))
+
+# Two-digit lowercase hex for every byte value, used to build hex strings
+# without running the format-spec machinery per channel.
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+
+def _check_channels(r: int, g: int, b: int) -> None:
+    """Raise ValueError unless every channel is in [0, 255]."""
+    # Any bit above the low byte (including the sign bit of a negative
+    # int) means a channel is outside [0, 255].
+    if (r | g | b) & ~0xFF:
+        raise ValueError("RGB values must be between 0 and 255.")
+
+
+class _RGBFields(NamedTuple):
+    r: int
+    g: int
+    b: int
+
+
+class RGB(_RGBFields):
     """
     Immutable RGB color representation.
 
@@ -110,14 +151,11 @@ class RGB:
         142.7
     """
 
-    __slots__ = ("r", "g", "b")
+    __slots__ = ()
 
-    def __init__(self, r: int, g: int, b: int):
-        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
-            raise ValueError("RGB values must be between 0 and 255.")
-        object.__setattr__(self, "r", r)
-        object.__setattr__(self, "g", g)
-        object.__setattr__(self, "b", b)
+    def __new__(cls, r: int, g: int, b: int):
+        _check_channels(r, g, b)
+        return super().__new__(cls, r, g, b)
 
     def __repr__(self) -> str:
         return f"RGB({self.r}, {self.g}, {self.b})"
@@ -128,21 +166,14 @@ class RGB:
         reset_ansi = AnsiColors.RESET
         return f"{bg_ansi}{hex_str}{reset_ansi}"
 
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, RGB):
-            return NotImplemented
-        return self.r == other.r and self.g == other.g and self.b == other.b
-
-    def __setattr__(self, name, value):
-        raise AttributeError("Cannot modify immutable RGB color.")
-
     @property
     def luma(self) -> float:
         """Calculate perceived brightness (luma)."""
-        r_lin = _to_linear(self.r)
-        g_lin = _to_linear(self.g)
-        b_lin = _to_linear(self.b)
-        luma_linear = 0.2126 * r_lin + 0.7152 * g_lin + 0.0722 * b_lin
+        luma_linear = (
+            0.2126 * _LINEAR[self.r]
+            + 0.7152 * _LINEAR[self.g]
+            + 0.0722 * _LINEAR[self.b]
+        )
         return luma_linear * 255.0
 
     @property
@@ -160,10 +191,10 @@ class RGB:
     @property
     def hex(self) -> str:
         """Convert RGB to a 6-digit hex string."""
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return "#" + _HEX[self.r] + _HEX[self.g] + _HEX[self.b]
 
 
-class HSL:
+class HSL(NamedTuple):
     """
     Immutable HSL (Hue, Saturation, Lightness) color representation.
 
@@ -184,32 +215,25 @@ class HSL:
         RGB(255, 128, 0)
     """
 
-    __slots__ = ("h", "s", "l")
-
-    def __init__(self, h: float, s: float, l: float):
-        object.__setattr__(self, "h", h)
-        object.__setattr__(self, "s", s)
-        object.__setattr__(self, "l", l)
+    h: float
+    s: float
+    l: float
 
     def __repr__(self) -> str:
         return f"HSL({self.h:.3f}, {self.s:.3f}, {self.l:.3f})"
 
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, HSL):
-            return NotImplemented
-        return self.h == other.h and self.s == other.s and self.l == other.l
-
-    def __setattr__(self, name, value):
-        raise AttributeError("Cannot modify immutable HSL color.")
-
     @property
     def rgb(self) -> RGB:
         """Convert HSL to RGB."""
-        r, g, b = colorsys.hls_to_rgb(self.h, self.l, self.s)
-        return RGB(round(r * 255), round(g * 255), round(b * 255))
+        r, g, b = _hue_to_rgb(self.h)
+        c = (1.0 - abs(2.0 * self.l - 1.0)) * self.s  # chroma
+        m = self.l - c / 2.0
+        return RGB(
+            round((r * c + m) * 255), round((g * c + m) * 255), round((b * c + m) * 255)
+        )
 
 
-class HSV:
+class HSV(NamedTuple):
     """
     Immutable HSV (Hue, Saturation, Value) color representation.
 
@@ -230,32 +254,32 @@ class HSV:
         RGB(255, 128, 0)
     """
 
-    __slots__ = ("h", "s", "v")
-
-    def __init__(self, h: float, s: float, v: float):
-        object.__setattr__(self, "h", h)
-        object.__setattr__(self, "s", s)
-        object.__setattr__(self, "v", v)
+    h: float
+    s: float
+    v: float
 
     def __repr__(self) -> str:
         return f"HSV({self.h:.3f}, {self.s:.3f}, {self.v:.3f})"
 
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, HSV):
-            return NotImplemented
-        return self.h == other.h and self.s == other.s and self.v == other.v
-
-    def __setattr__(self, name, value):
-        raise AttributeError("Cannot modify immutable HSV color.")
-
     @property
     def rgb(self) -> RGB:
         """Convert HSV to RGB."""
-        r, g, b = colorsys.hsv_to_rgb(self.h, self.s, self.v)
-        return RGB(round(r * 255), round(g * 255), round(b * 255))
+        r, g, b = _hue_to_rgb(self.h)
+        c = self.v * self.s  # chroma
+        m = self.v - c
+        return RGB(
+            round((r * c + m) * 255), round((g * c + m) * 255), round((b * c + m) * 255)
+        )
+
 
+class _RGBAFields(NamedTuple):
+    r: int
+    g: int
+    b: int
+    a: float
 
-class RGBA:
+
+class RGBA(_RGBAFields):
     """
     Immutable RGBA color with transparency.
 
@@ -290,48 +314,25 @@ class RGBA:
         False
     """
 
-    __slots__ = ("_rgb", "a")
+    __slots__ = ()
 
-    def __init__(self, r: int, g: int, b: int, a: float):
-        object.__setattr__(self, "_rgb", RGB(r, g, b))
+    def __new__(cls, r: int, g: int, b: int, a: float):
+        _check_channels(r, g, b)
         if not (0.0 <= a <= 1.0):
             raise ValueError("Alpha value must be between 0.0 and 1.0.")
-        object.__setattr__(self, "a", a)
-
-    @property
-    def r(self) -> int:
-        return self._rgb.r
-
-    @property
-    def g(self) -> int:
-        return self._rgb.g
-
-    @property
-    def b(self) -> int:
-        return self._rgb.b
-
-    @property
-    def luma(self) -> float:
-        return self._rgb.luma
-
-    @property
-    def hsl(self) -> "HSL":
-        return self._rgb.hsl
-
-    @property
-    def hsv(self) -> "HSV":
-        return self._rgb.hsv
+        return super().__new__(cls, r, g, b, a)
 
-    @property
-    def hex(self) -> str:
-        """Return the 6-digit hex string (without alpha)."""
-        return self._rgb.hex
+    # These only read the r, g and b fields, so RGB's implementations are shared.
+    luma = RGB.luma
+    hsl = RGB.hsl
+    hsv = RGB.hsv
+    hex = RGB.hex
 
     @property
     def hex8(self) -> str:
         """Convert RGBA to an 8-digit hex string."""
-        alpha_hex = f"{round(self.a * 255):02x}"
-        return f"{self.hex}{alpha_hex}"
+        # a is validated to [0, 1], so adding 0.5 and truncating rounds correctly
+        return self.hex + _HEX[int(self.a * 255 + 0.5)]
 
     def __repr__(self) -> str:
         return f"RGBA({self.r}, {self.g}, {self.b}, {self.a})"
@@ -342,21 +343,8 @@ class RGBA:
         reset_ansi = AnsiColors.RESET
         return f"{bg_ansi}{hex_str}{reset_ansi}"
 
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, RGBA):
-            return NotImplemented
-        return (
-            self.r == other.r
-            and self.g == other.g
-            and self.b == other.b
-            and self.a == other.a
-        )
-
-    def __setattr__(self, name, value):
-        raise AttributeError("Cannot modify immutable RGBA color.")
-
 
-class ColorData:
+class ColorData(NamedTuple):
     """
     Immutable color with coverage metric.
 
@@ -379,11 +367,8 @@ class ColorData:
         '#ff8000'
     """
 
-    __slots__ = ("rgb", "coverage")
-
-    def __init__(self, rgb: RGB, coverage: float):
-        object.__setattr__(self, "rgb", rgb)
-        object.__setattr__(self, "coverage", coverage)
+    rgb: RGB
+    coverage: float
 
     def __repr__(self) -> str:
         return f"ColorData({self.rgb!r}, coverage={self.coverage})"
@@ -393,11 +378,3 @@ class ColorData:
         hex_str = self.rgb.hex
         reset_ansi = AnsiColors.RESET
         return f"{bg_ansi}{hex_str}{reset_ansi} Coverage={self.coverage:.3f}"
-
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, ColorData):
-            return NotImplemented
-        return self.rgb == other.rgb and self.coverage == other.coverage
-
-    def __setattr__(self, name, value):
-        raise AttributeError("Cannot modify immutable ColorData.")
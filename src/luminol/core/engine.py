@@ -1,16 +1,27 @@
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+import hashlib
 import logging
+import os
 from pathlib import Path
+import pickle
 import shutil
+import struct
+import sys
 import time
 
+from .. import __version__
 from ..cli.term_colors import AnsiColors, preview_theme, show_terminal_colors
 from ..core.tty_reload import reload_tty_and_save_sequence
 from ..utils.logging_config import configure_logging
 from ..color.color_assign import assign_color
 from ..color.extraction import extract_colors
-from ..config.parser import Config, load_config
+from ..config.parser import AppSettings, Config, load_config
+from ..core.data_types import ColorData
 from ..exceptions import InvalidConfigError, WallpaperSetError
-from ..utils.file_io import write_file
+from ..utils.file_io import batch_write
 from ..utils.palette_generator import compile_color_syntax, compile_template
 from ..utils.path_utils import (
     clear_directory,
@@ -21,95 +32,269 @@ from ..utils.path_utils import (
 )
 from ..utils.system_actions import apply_wallpaper, run_reload_commands
 
-LUMINOL_CONFIG_DIR = get_luminol_dir()
-LUMINOL_CACHE_DIR = get_cache_dir()
 
+# Extracted palettes are also pickled to disk under the cache dir, keyed by a
+# digest of the image, so a new process re-applying a known wallpaper skips
+# extraction entirely.
+PALETTE_CACHE_NAME = "palettes"
+# Bump whenever extraction changes its output; the luminol version is part of
+# the key as well.
+_PALETTE_CACHE_VERSION = 1
+# Least recently used palettes beyond this count are removed on each write.
+_PALETTE_CACHE_MAX_ENTRIES = 64
+# Above this size only the stat info and the first MiB of the image are hashed.
+_FULL_HASH_LIMIT = 10 * 1024 * 1024
+_PARTIAL_HASH_BYTES = 1024 * 1024
+
+
+def _image_digest(image_path: str, mtime_ns: int, size: int) -> str:
+    """Content digest of an image, cheap enough to compute on every run."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(image_path, "rb") as image:
+        if size <= _FULL_HASH_LIMIT:
+            digest.update(image.read())
+        else:
+            digest.update(struct.pack("<qQ", mtime_ns, size))
+            digest.update(image.read(_PARTIAL_HASH_BYTES))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=4)
+def _extract_cached(
+    image_path: str,
+    mtime_ns: int,
+    size: int,
+    num_colors: int,
+    preset: str,
+    sort_by: str,
+) -> tuple[ColorData, ...]:
+    key = _image_digest(image_path, mtime_ns, size)
+    version = f"v{_PALETTE_CACHE_VERSION}-{__version__}"
+    cache_file = get_cache_dir() / PALETTE_CACHE_NAME / (
+        f"{key}-{preset}-{num_colors}-{sort_by}-{version}.pkl"
+    )
 
-def handle_preview_mode(image_path: str | Path, quality: str):
-    logging.info("Extracting colors...")
-    start = time.perf_counter()
-
-    colors = extract_colors(
-        image_path=str(image_path),
-        num_colors=8,
-        preset=quality,
-        sort_by="luma",
+    try:
+        color_data = pickle.loads(cache_file.read_bytes())
+        if isinstance(color_data, tuple):
+            logging.debug("Using cached palette: %s", cache_file)
+            # the mtime records the last use, for pruning
+            with suppress(OSError):
+                os.utime(cache_file)
+            return color_data
+    except FileNotFoundError:
+        pass
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        logging.debug("Ignoring unreadable palette cache: %s", cache_file)
+
+    color_data = tuple(
+        extract_colors(
+            image_path=image_path, num_colors=num_colors, preset=preset, sort_by=sort_by
+        )
     )
 
-    print("Extracted Colors:")
-    for col in colors:
-        print(col.rgb, end=" ", flush=True)
+    # write to a temporary name first so a concurrent run never reads a
+    # partially written pickle
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(pickle.dumps(color_data, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logging.debug("Could not write palette cache %s: %s", cache_file, e)
+    else:
+        _prune_palette_cache(cache_file.parent)
+
+    return color_data
+
 
-        logging.debug(
-            "Coverage: %5.3f H: %6.2f  S: %4.2f  V: %4.2f",
-            col.coverage,
-            col.rgb.hsv.h * 360,
-            col.rgb.hsv.s,
-            col.rgb.hsv.v,
+def _prune_palette_cache(cache_dir: Path) -> None:
+    """Remove the least recently used palettes past the entry limit."""
+    try:
+        with os.scandir(cache_dir) as entries:
+            files = [
+                (entry.stat().st_mtime_ns, entry.path)
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+            ]
+    except OSError as e:
+        logging.debug("Could not scan palette cache %s: %s", cache_dir, e)
+        return
+
+    if len(files) <= _PALETTE_CACHE_MAX_ENTRIES:
+        return
+
+    files.sort()
+    for _, path in files[: len(files) - _PALETTE_CACHE_MAX_ENTRIES]:
+        # may already be gone, e.g. pruned by a concurrent run
+        with suppress(OSError):
+            os.unlink(path)
+
+
+def _extract_colors(
+    image_path: str | Path, num_colors: int, preset: str, sort_by: str = "luma"
+) -> list[ColorData]:
+    """
+    extract_colors, memoized per image file while it is unchanged.
+
+    Extraction is seeded and deterministic, so results are reused from
+    memory within a long-lived process (the daemon) and from the on-disk
+    palette cache across runs.
+    """
+    stat = os.stat(image_path)
+    return list(
+        _extract_cached(
+            str(image_path), stat.st_mtime_ns, stat.st_size, num_colors, preset, sort_by
         )
+    )
 
-    print("\n")
-    end = time.perf_counter()
-    logging.info("Color Extraction took %.4f seconds", end - start)
 
+def _load_config(config_path: Path) -> Config:
+    """Parse and validate config_path into a Config."""
+    return Config(config_data=load_config(config_file_path=config_path))
 
-def generate_palette_files(config: Config, color_palette: dict):
-    enabled_apps = config.enabled_apps
 
-    for app in enabled_apps:
-        app_settings = config.get_app(app)
-        output_dir = Path(app_settings.output_file)
-        cache_path = LUMINOL_CACHE_DIR / f"{app}" / output_dir.name
+@contextmanager
+def _timed(message: str, level: int = logging.DEBUG) -> Iterator[None]:
+    """
+    Log how long the block took as message % seconds.
 
-        syntax = app_settings.syntax
-        fmt = app_settings.color_format
-        remap = app_settings.colors if app_settings.remap_colors else None
+    The clock is only read when level is enabled, so normal runs pay nothing.
+    """
+    if not logging.getLogger().isEnabledFor(level):
+        yield
+        return
 
-        template_path = app_settings.template
-        if not template_path:
-            palette = compile_color_syntax(
-                named_colors=color_palette,
-                syntax=syntax,
-                color_format=fmt,
-                remap=remap,
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        logging.log(level, message, time.perf_counter() - start)
+
+
+def handle_preview_mode(image_path: str | Path, quality: str):
+    logging.info("Extracting colors...")
+    with _timed("Color Extraction took %.4f seconds", level=logging.INFO):
+        colors = _extract_colors(
+            image_path=image_path, num_colors=8, preset=quality, sort_by="luma"
+        )
+
+    # One write for the whole preview instead of a flushed print per color
+    sys.stdout.write(
+        "Extracted Colors:\n" + " ".join(str(col.rgb) for col in colors) + "\n\n"
+    )
+    sys.stdout.flush()
+
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        for col in colors:
+            hsv = col.rgb.hsv
+            logging.debug(
+                "Coverage: %5.3f H: %6.2f  S: %4.2f  V: %4.2f",
+                col.coverage,
+                hsv.h * 360,
+                hsv.s,
+                hsv.v,
             )
-            write_file(cache_path, palette)
-            continue
 
-        # template mode
-        try:
-            text = Path(template_path).read_text(encoding="utf-8")
-        except FileNotFoundError:
-            logging.error("Template not found: %s", template_path)
-            raise SystemExit(1)
 
-        except Exception:
-            logging.exception("Template read error")
-            raise SystemExit(1)
+def _resolve_paths(config: Config) -> list[tuple[str, Path, Path]]:
+    """Return (app, cache_path, destination) for every enabled app."""
+    paths = []
+    for app in config.enabled_apps:
+        destination = Path(config.get_app(app).output_file)
+        paths.append((app, get_cache_dir() / app / destination.name, destination))
+    return paths
 
-        rendered = compile_template(
+
+def generate_palette_files(
+    config: Config, color_palette: dict, paths: list[tuple[str, Path, Path]]
+):
+    templates = {}
+    for app, _, _ in paths:
+        template = config.get_app(app).template
+        if template:
+            templates[app] = template
+
+    # Template files are independent, so they are all read up front in
+    # parallel; errors surface from result() at the same point as before.
+    # An executor with nothing submitted starts no threads.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(templates)))) as executor:
+        pending = {
+            app: executor.submit(Path(template).read_bytes)
+            for app, template in templates.items()
+        }
+        _write_palettes(config, color_palette, paths, pending)
+
+
+def _build_palette(
+    app_settings: AppSettings, color_palette: dict, template_text: str | None
+) -> bytes:
+    """Render one app's palette file from the assigned colors."""
+    syntax = app_settings.syntax
+    fmt = app_settings.color_format
+    remap = app_settings.colors if app_settings.remap_colors else None
+
+    if template_text is None:
+        palette = compile_color_syntax(
             named_colors=color_palette,
             syntax=syntax,
-            template=text,
-            remap=remap,
             color_format=fmt,
+            remap=remap,
         )
-        write_file(cache_path, rendered)
+        return "\n".join(palette).encode("utf-8")
+
+    # template mode
+    rendered = compile_template(
+        named_colors=color_palette,
+        syntax=syntax,
+        template=template_text,
+        remap=remap,
+        color_format=fmt,
+    )
+    return rendered.encode("utf-8")
 
 
-def export_palettes(config: Config):
-    for app in config.enabled_apps:
+def _write_palettes(
+    config: Config,
+    color_palette: dict,
+    paths: list[tuple[str, Path, Path]],
+    pending: dict[str, Future],
+):
+    rendered_files: list[tuple[Path, bytes]] = []
+    for app, cache_path, _ in paths:
         app_settings = config.get_app(app)
-        destination = Path(app_settings.output_file)
-        source = LUMINOL_CACHE_DIR / f"{app}" / destination.name
 
+        text = None
+        template_path = app_settings.template
+        if template_path:
+            try:
+                text = pending[app].result().decode("utf-8")
+            except FileNotFoundError:
+                logging.error("Template not found: %s", template_path)
+                raise SystemExit(1)
+
+            except (OSError, UnicodeDecodeError):
+                logging.exception("Template read error")
+                raise SystemExit(1)
+
+        rendered_files.append(
+            (cache_path, _build_palette(app_settings, color_palette, text))
+        )
+
+    # every palette is rendered before anything is written, then the files
+    # go out in one batch
+    batch_write(rendered_files)
+
+
+def export_palettes(paths: list[tuple[str, Path, Path]]):
+    for app, source, destination in paths:
         try:
             shutil.copy(src=source, dst=destination)
         except FileNotFoundError:
             logging.exception(
                 "Destination not found: '%s'. Cannot export '%s'.", destination, app
             )
-        except Exception:
+        except OSError:
             logging.exception("Failed to copy '%s' to '%s'", source, destination)
 
 
@@ -124,27 +309,20 @@ def set_wallpaper(config: Config, image_path: str | Path, log_dir: None | str |
                 use_shell=config.global_settings.use_shell,
             )
         except WallpaperSetError:
+            # apply_wallpaper wraps every launch failure in WallpaperSetError
             logging.exception("Wallpaper command: '%s' failed", cmd)
             raise SystemExit(1)
 
-        except Exception:
-            logging.exception("Unexpected error occurred while setting wallpaper.")
-            raise SystemExit(1)
-
 
 def reload_commands(config: Config, log_dir: Path | str | None):
     cmd_list: list = config.global_settings.reload_commands
     if cmd_list:
-        try:
-            run_reload_commands(
-                reload_commands=cmd_list,
-                use_shell=config.global_settings.use_shell,
-                log_dir=log_dir,
-            )
-
-        except Exception:
-            logging.exception("Unexpected error occurred while reloading.")
-            raise SystemExit(1)
+        # launch failures are logged per command inside run_reload_commands
+        run_reload_commands(
+            reload_commands=cmd_list,
+            use_shell=config.global_settings.use_shell,
+            log_dir=log_dir,
+        )
 
 
 def run_luminol(
@@ -168,13 +346,12 @@ def run_luminol(
         raise SystemExit(0)
 
     try:
-        raw_config = load_config(config_file_path=LUMINOL_CONFIG_DIR / "config.toml")
-        config = Config(config_data=raw_config)
+        config = _load_config(get_luminol_dir() / "config.toml")
     except InvalidConfigError as e:
         print(f"\n{e}")
         raise SystemExit(1) from e
 
-    except Exception as e:
+    except OSError as e:
         logging.exception("Failed to load configuration")
         raise SystemExit(1) from e  # exit with exit code 1
 
@@ -192,15 +369,33 @@ def run_luminol(
     else:
         log_dir = None
 
+    # Launching the wallpaper command and clearing the old cache are independent
+    # of color extraction, so they run in worker threads while the image is
+    # decoded on the main thread. The wallpaper command is joined right after
+    # extraction, so a failure still stops the run before anything is shown or
+    # written; the cache clear is joined before the cache is written to.
+    executor = ThreadPoolExecutor(max_workers=2)
+    wallpaper_future = None
     if not dry_run_only:
         # if wallpaper-command is not set then skip execution of wallpaper command
-        set_wallpaper(config=config, image_path=image_path, log_dir=log_dir)
+        wallpaper_future = executor.submit(
+            set_wallpaper, config=config, image_path=image_path, log_dir=log_dir
+        )
 
-    logging.info("Extracting colors...")
-    extract_start = time.perf_counter()
-    color_data = extract_colors(
-        image_path=image_path, num_colors=8, preset=quality, sort_by="luma"
+    # clear cache
+    clear_future = executor.submit(
+        clear_directory,
+        dir_path=get_cache_dir(),
+        preserve_dir=True,
+        keep=(PALETTE_CACHE_NAME,),
     )
+    executor.shutdown(wait=False)
+
+    logging.info("Extracting colors...")
+    with _timed("Extraction took: %s"):
+        color_data = _extract_colors(
+            image_path=image_path, num_colors=8, preset=quality, sort_by="luma"
+        )
     if verbose:
         for col in color_data:
             logging.debug(
@@ -211,53 +406,54 @@ def run_luminol(
                 col.rgb.hsv.v,
             )
 
-    extract_end = time.perf_counter()
-    logging.debug("Extraction took: %s", extract_end - extract_start)
-
-    assign_start_time = time.perf_counter()
-
-    # clear cache
-    clear_directory(dir_path=LUMINOL_CACHE_DIR, preserve_dir=True)
-    logging.info("Old cache cleared")
-
-    # if theme is set in cli then override the theme_type in config
-    if theme_type is not None:
-        color_palette = assign_color(
-            color_data=color_data,
-            theme_type=theme_type,
-            presorted=True,
-        )
-    else:
-        color_palette = assign_color(
-            color_data=color_data,
-            theme_type=config.global_settings.theme_type,
-            presorted=True,
-        )
+    if wallpaper_future is not None:
+        # re-raises SystemExit from a failed wallpaper command
+        wallpaper_future.result()
+
+    with _timed("Color assign took %s"):
+        # if theme is set in cli then override the theme_type in config
+        if theme_type is not None:
+            color_palette = assign_color(
+                color_data=color_data,
+                theme_type=theme_type,
+                presorted=True,
+            )
+        else:
+            color_palette = assign_color(
+                color_data=color_data,
+                theme_type=config.global_settings.theme_type,
+                presorted=True,
+            )
 
-    preview_theme(color_palette)
-    assign_end_time = time.perf_counter()
-    logging.debug("Color assign took %s", assign_end_time - assign_start_time)
+        preview_theme(color_palette)
 
-    # generate palette files
-    palette_start_time = time.perf_counter()
+    # generate palette files; the timing is shown by default only for
+    # --dry-run, where it ends the run
+    palette_level = logging.INFO if dry_run_only else logging.DEBUG
+    with _timed("Palette creation took %s", level=palette_level):
+        # re-raises any exception from the worker thread
+        clear_future.result()
+        logging.info("Old cache cleared")
 
-    generate_palette_files(config=config, color_palette=color_palette)
+        app_paths = _resolve_paths(config)
+        generate_palette_files(
+            config=config, color_palette=color_palette, paths=app_paths
+        )
 
     if dry_run_only is True:
         # when dry_run is enabled
         # terminate just after palette_files are saved to cache
-        palette_end_time = time.perf_counter()
-        logging.info("Palette creation took %s", palette_end_time - palette_start_time)
         raise SystemExit(0)
 
     ## final export to output_dir
-    export_palettes(config=config)
+    with _timed("Palette export took %s"):
+        export_palettes(paths=app_paths)
 
     if config.global_settings.tty_reload:
-        sequence_file = LUMINOL_CACHE_DIR / "sequence"
+        sequence_file = get_cache_dir() / "sequence"
         style = config.global_settings.terminal_color_style
         if style == "pywal":
-            color_data = extract_colors(
+            color_data = _extract_colors(
                 image_path=image_path, num_colors=16, preset=quality, sort_by="luma"
             )
 
@@ -270,11 +466,6 @@ def run_luminol(
 
     show_terminal_colors()
 
-    palette_end_time = time.perf_counter()
-    logging.info(
-        "Palette creation and export took %s", palette_end_time - palette_start_time
-    )
-
     reload_commands(config=config, log_dir=log_dir)
 
     if log_dir:
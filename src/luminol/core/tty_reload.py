@@ -1,44 +1,53 @@
-import glob
-from pathlib import Path
 import logging
+import os
+from pathlib import Path
 
 from ..color.ansi_colors.assign_ansi import generate_ansi
 from .data_types import ColorData, RGB
 
 
-def tty_color_sequence(theme: dict[str, RGB]) -> str:
+_ANSI_KEYS = tuple(f"ansi-{i}" for i in range(16))
+_OSC4_PREFIX = tuple(f"\033]4;{i};" for i in range(16))
+
+
+def tty_color_sequence(theme: dict[str, RGB]) -> bytes:
     """
-    Generates a string of OSC escape sequences to theme a terminal.
+    Generates the OSC escape sequences to theme a terminal.
 
     Args:
         theme: A dictionary with 'background', 'foreground', and 'ansi-0'...'ansi-15' keys.
 
     Returns:
-        A single string containing all necessary OSC escape codes.
+        All necessary OSC escape codes, encoded and ready to be written.
     """
-    sequence = ""
+    parts = []
 
     # Set background color (OSC 11)
     if "background" in theme:
-        sequence += f"\033]11;{theme['background'].hex}\007"
+        parts.append(f"\033]11;{theme['background'].hex}\007")
 
     # Set foreground/text color (OSC 10)
     if "foreground" in theme:
-        sequence += f"\033]10;{theme['foreground'].hex}\007"
+        parts.append(f"\033]10;{theme['foreground'].hex}\007")
 
     # Set cursor color (OSC 12)
     if "cursor" in theme:
-        sequence += f"\033]12;{theme['cursor'].hex}\007"
+        parts.append(f"\033]12;{theme['cursor'].hex}\007")
     elif "foreground" in theme:  # Fallback cursor to foreground
-        sequence += f"\033]12;{theme['foreground'].hex}\007"
+        parts.append(f"\033]12;{theme['foreground'].hex}\007")
 
     # Set ANSI colors 0-15 (OSC 4)
-    for i in range(16):
-        ansi_key = f"ansi-{i}"
-        if ansi_key in theme:
-            sequence += f"\033]4;{i};{theme[ansi_key].hex}\007"
+    for ansi_key, prefix in zip(_ANSI_KEYS, _OSC4_PREFIX):
+        rgb = theme.get(ansi_key)
+        if rgb is not None:
+            parts.append(prefix + rgb.hex + "\007")
+
+    return "".join(parts).encode()
+
 
-    return sequence
+def _squared_norm(rgb: RGB) -> int:
+    r, g, b = rgb
+    return r * r + g * g + b * b
 
 
 def tty_colors_pywal(
@@ -49,33 +58,27 @@ def tty_colors_pywal(
     It arranges the extracted colors into the 16 ANSI slots.
     """
 
-    if len(color_data) > 8:
-        color_data = color_data[:8]
-
-    # unnescessary, but this is how imagemagick output colors are sorted by default
-    color_data.sort(key=lambda col: col.rgb.r**2 + col.rgb.g**2 + col.rgb.b**2)
-
-    colors = [c.rgb for c in color_data]
-
-    tty_theme = {}
-
-    # Set background, foreground, and cursor from the main theme dict
-    tty_theme["background"] = assigned_dict["bg-primary"]
-    tty_theme["foreground"] = assigned_dict["text-primary"]
-    tty_theme["cursor"] = assigned_dict["accent-primary"]
-
-    for i in range(8):
-        tty_theme[f"ansi-{i}"] = colors[i]
-
-    for i in range(8, 16):
-        tty_theme[f"ansi-{i}"] = colors[i - 8]
-
-    # Override specific slots for a more conventional terminal theme
-    # This follows pywal's general structure
-    tty_theme["ansi-0"] = tty_theme["background"]  # Black
-    tty_theme["ansi-7"] = tty_theme["foreground"]  # White (slightly dimmed)
-    tty_theme["ansi-8"] = assigned_dict["bg-secondary"]
-    tty_theme["ansi-15"] = tty_theme["foreground"]  # Bright White
+    # unnescessary, but this is how imagemagick output colors are sorted by default.
+    # RGB is a tuple, so unpacking it beats three attribute loads and `**`;
+    # sorted() also leaves the caller's list untouched.
+    colors = sorted((c.rgb for c in color_data[:8]), key=_squared_norm)
+
+    background = assigned_dict["bg-primary"]
+    foreground = assigned_dict["text-primary"]
+
+    # Colors 1-6 repeat as their bright variants 9-14. The remaining slots
+    # follow pywal's general structure for a more conventional terminal theme.
+    tty_theme = {
+        "background": background,
+        "foreground": foreground,
+        "cursor": assigned_dict["accent-primary"],
+        "ansi-0": background,  # Black
+        "ansi-7": foreground,  # White (slightly dimmed)
+        "ansi-8": assigned_dict["bg-secondary"],
+        "ansi-15": foreground,  # Bright White
+    }
+    for i in range(1, 7):
+        tty_theme[f"ansi-{i}"] = tty_theme[f"ansi-{i + 8}"] = colors[i]
 
     return tty_theme
 
@@ -103,8 +106,39 @@ def get_ttys() -> list[str]:
     This logic is adapted from pywal by Dylan Araps.
     https://github.com/dylanaraps/pywal
     """
-    tty_pattern = "/dev/pts/[0-9]*"
-    return glob.glob(tty_pattern)
+    # pts entries are plain numbers; listing the directory avoids glob's
+    # pattern matching and per-entry stat
+    try:
+        names = os.listdir("/dev/pts")
+    except OSError:
+        return []
+    return [f"/dev/pts/{name}" for name in names if name.isdigit()]
+
+
+def _write_tty(tty: str, sequence: bytes) -> None:
+    """Write the whole sequence to tty, normally in a single write() call."""
+    # never block on, or become controlled by, a terminal
+    try:
+        fd = os.open(tty, os.O_WRONLY | os.O_NONBLOCK | os.O_NOCTTY)
+    except PermissionError:
+        logging.error("Could not open tty: %s for writing.", tty)
+        return
+    except OSError:
+        # the pts may have closed since it was listed
+        return
+    try:
+        view = memoryview(sequence)
+        # a pty may accept only part of the sequence; keep writing the rest
+        while view:
+            view = view[os.write(fd, view) :]
+    except BlockingIOError:
+        # the terminal's buffer is full (nobody is reading it); skip it
+        # rather than wait
+        logging.debug("Skipping busy tty: %s", tty)
+    except OSError as e:
+        logging.error("Could not write to tty: %s (%s)", tty, e)
+    finally:
+        os.close(fd)
 
 
 def reload_tty_and_save_sequence(
@@ -118,23 +152,19 @@ def reload_tty_and_save_sequence(
     elif style == "pywal":
         colors = tty_colors_pywal(assigned_dict, color_data)
     else:
-        raise ValueError("Invalid terminal color style:", style)
+        raise ValueError(f"Invalid terminal color style: {style}")
 
     sequence = tty_color_sequence(colors)
 
+    # writes are non-blocking, so each tty takes microseconds and a busy
+    # one cannot hold up the others
     for tty in get_ttys():
-        try:
-            with open(tty, "w") as f:
-                f.write(sequence)
-        except PermissionError:
-            logging.error(f"Could not open tty: {tty} for writing.")
+        _write_tty(tty, sequence)
 
     if not sequence_file:
         return
 
     try:
-        with open(sequence_file, "w") as f:
-            f.write(sequence)
-
+        Path(sequence_file).write_bytes(sequence)
     except PermissionError:
-        logging.error(f"Could not save the ansi sequence to :'{sequence_file}'")
+        logging.error("Could not save the ansi sequence to :'%s'", sequence_file)
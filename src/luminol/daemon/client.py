@@ -4,55 +4,113 @@ import os
 import socket
 from typing import Any
 
-from .protocol import request_to_server
-from .protocol import PID_FILE, SOCKET_FILE
-
-
-def send_request(request: str) -> dict[str, Any]:
-    if not os.path.exists(PID_FILE):
-        raise ConnectionRefusedError("Daemon not running (PID file missing)")
-
-    if not os.path.exists(SOCKET_FILE):
-        # PID file exists but socket is gone, indicates a stale PID file
-        # or a daemon that crashed without cleaning up.
-        raise FileNotFoundError("Daemon socket missing. The daemon may have crashed.")
-
-    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    try:
-        client.connect(str(SOCKET_FILE))
-        client.sendall(request.encode("utf-8"))
-
-        with client.makefile("r", encoding="utf-8") as stream:
-            # readline() waits for the server's newline
-            raw_response = stream.readline()
-            if not raw_response:
-                logging.warning("Server sent empty response")
-
-            try:
-                response: dict = json.loads(raw_response)
-                logging.debug("Server replied: %s", response)
-
-            except json.JSONDecodeError:
-                # Send raw error if JSON is bad
-                logging.exception(f"Bad json response: {raw_response}")
-                raise
-
-            return response
-
-    finally:
-        client.close()
-
-
-def run(payload: dict) -> str:
-    request: str = request_to_server(action="run", payload=payload)
+from .protocol import decode_message, peer_uid_of, read_message, request_to_server
+from .protocol import ABSTRACT_SOCKET, PID_FILE, SOCKET_FILE
+
+
+class DaemonClient:
+    """
+    A connection to the daemon that can carry several requests.
+
+    Use as a context manager to connect once and send any number of
+    requests before closing:
+
+        >>> with DaemonClient() as client:
+        ...     client.send(ping())
+        ...     client.send(run(payload))
+    """
+
+    def __init__(self):
+        self._sock: socket.socket | None = None
+
+    def connect(self) -> None:
+        if not os.path.exists(PID_FILE):
+            raise ConnectionRefusedError("Daemon not running (PID file missing)")
+
+        if not ABSTRACT_SOCKET and not os.path.exists(SOCKET_FILE):
+            # PID file exists but socket is gone, indicates a stale PID file
+            # or a daemon that crashed without cleaning up.
+            raise FileNotFoundError(
+                "Daemon socket missing. The daemon may have crashed."
+            )
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(SOCKET_FILE))
+            # An abstract socket has no file permissions, so any local user
+            # could have bound the name first. Only talk to a server running
+            # as this user; requests carry image paths and config.
+            server_uid = peer_uid_of(sock)
+        except OSError:
+            sock.close()
+            raise
+        if server_uid is not None and server_uid != os.getuid():
+            sock.close()
+            raise ConnectionRefusedError(
+                f"Daemon socket is held by another user (uid {server_uid})"
+            )
+        self._sock = sock
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self) -> "DaemonClient":
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def send(self, request: bytes) -> dict[str, Any]:
+        """Send one framed request and wait for its response."""
+        if self._sock is None:
+            self.connect()
+        assert self._sock is not None
+
+        self._sock.sendall(request)
+
+        raw_response = read_message(self._sock)
+        if not raw_response:
+            logging.warning("Server sent empty response")
+
+        try:
+            response: dict = decode_message(raw_response)
+            logging.debug("Server replied: %s", response)
+
+        except json.JSONDecodeError:
+            # Send raw error if JSON is bad
+            logging.exception("Bad json response: %r", raw_response)
+            raise
+
+        return response
+
+
+def send_request(request: bytes, client: DaemonClient | None = None) -> dict[str, Any]:
+    """
+    Send a request to the daemon.
+
+    Reuses client's connection if one is given, otherwise opens a
+    connection for this request only.
+    """
+    if client is not None:
+        return client.send(request)
+
+    with DaemonClient() as one_shot:
+        return one_shot.send(request)
+
+
+def run(payload: dict) -> bytes:
+    request: bytes = request_to_server(action="run", payload=payload)
     return request
 
 
-def server_stop() -> str:
-    request: str = request_to_server(action="stop")
+def server_stop() -> bytes:
+    request: bytes = request_to_server(action="stop")
     return request
 
 
-def ping() -> str:
-    request: str = request_to_server(action="ping")
+def ping() -> bytes:
+    request: bytes = request_to_server(action="ping")
     return request
@@ -1,27 +1,118 @@
 import json
+import os
 from pathlib import Path
+import socket
+import struct
+import sys
+from typing import Any
 
-RUNTIME_DIR = Path("/tmp") / "luminol"
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+# Per-user, like the socket name below, so two users' daemons never share
+# (or signal each other through) a pidfile.
+if os.environ.get("XDG_RUNTIME_DIR"):
+    RUNTIME_DIR = Path(os.environ["XDG_RUNTIME_DIR"]) / "luminol"
+else:
+    RUNTIME_DIR = Path("/tmp") / f"luminol-{os.getuid()}"
 PID_FILE = RUNTIME_DIR / "luminol.pid"
-SOCKET_FILE = RUNTIME_DIR / "luminol.sock"
+
+# On Linux the socket lives in the abstract namespace (leading NUL byte):
+# there is no inode to leak, and the name is released when the daemon exits.
+# Other platforms fall back to a socket file in RUNTIME_DIR.
+ABSTRACT_SOCKET = sys.platform.startswith("linux")
+SOCKET_FILE: str | Path
+if ABSTRACT_SOCKET:
+    SOCKET_FILE = f"\0luminol-{os.getuid()}.sock"
+else:
+    SOCKET_FILE = RUNTIME_DIR / "luminol.sock"
+
+# Every message is a 4-byte big-endian body length followed by the JSON body.
+_HEADER = struct.Struct(">I")
+HEADER_SIZE = _HEADER.size
+# Upper bound on a body, so a garbled header cannot trigger a huge allocation
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+
+def encode_message(message: dict) -> bytes:
+    """Serialize a message to a length-prefixed UTF-8 JSON frame."""
+    if orjson is not None:
+        body = orjson.dumps(message)
+    else:
+        body = json.dumps(message).encode("utf-8")
+    return _HEADER.pack(len(body)) + body
+
+
+def decode_message(raw: bytes | str) -> Any:
+    """
+    Parse a JSON message.
+
+    Raises json.JSONDecodeError on bad input (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# struct ucred {pid_t pid; uid_t uid; gid_t gid;}
+_UCRED = struct.Struct("iII")
 
 
-def response_to_client(success: bool, logs: str, error: str | None = None) -> str:
+def peer_uid_of(sock: socket.socket) -> int | None:
+    """Return the uid of the process on the other end of sock, if known."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None  # not Linux; rely on the socket's file permissions
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _UCRED.size)
+    _, uid, _ = _UCRED.unpack(creds)
+    return uid
+
+
+def _recv_exact_into(sock: socket.socket, view: memoryview) -> bool:
+    """Fill view from sock. Returns False if the peer closed first."""
+    while view:
+        received = sock.recv_into(view)
+        if not received:
+            return False
+        view = view[received:]
+    return True
+
+
+def read_message(sock: socket.socket) -> bytearray:
+    """
+    Read one framed message body from sock.
+
+    Returns an empty buffer if the connection closed before a full message
+    arrived or the announced size is over MAX_MESSAGE_SIZE.
+    """
+    header = bytearray(_HEADER.size)
+    if not _recv_exact_into(sock, memoryview(header)):
+        return bytearray()
+
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_MESSAGE_SIZE:
+        return bytearray()
+
+    body = bytearray(length)
+    if not _recv_exact_into(sock, memoryview(body)):
+        return bytearray()
+    return body
+
+
+def response_to_client(success: bool, logs: str, error: str | None = None) -> bytes:
     response: dict = {"success": success, "logs": logs, "error": error}
-    json_response: str = json.dumps(response) + "\n"
-    return json_response
+    return encode_message(response)
 
 
-def request_to_server(action: str, payload: dict | None = None) -> str:
+def request_to_server(action: str, payload: dict | None = None) -> bytes:
     SUPPORTED_ACTIONS = ("run", "ping", "stop")
     if action not in SUPPORTED_ACTIONS:
         raise ValueError(
             f"{action}  is no a valid action. Supported actions are {' ,'.join(SUPPORTED_ACTIONS)}"
         )
     request: dict = {"action": action, "payload": payload}
-    json_request: str = json.dumps(request) + "\n"
-
-    return json_request
+    return encode_message(request)
 
 
 def print_response_and_exit(response: dict):
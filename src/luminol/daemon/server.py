@@ -1,11 +1,21 @@
 import socket
 import json
 import os
+import signal
 import sys
-import io
 import contextlib
 
-from .protocol import response_to_client, RUNTIME_DIR, PID_FILE, SOCKET_FILE
+from .protocol import (
+    HEADER_SIZE,
+    decode_message,
+    peer_uid_of,
+    read_message,
+    response_to_client,
+    ABSTRACT_SOCKET,
+    RUNTIME_DIR,
+    PID_FILE,
+    SOCKET_FILE,
+)
 from ..cli.term_colors import AnsiColors as AC
 
 from PIL import Image
@@ -19,11 +29,19 @@ np.array([])
 from ..core.engine import run_luminol
 
 
-def daemonize():
-    """Detach the process from the terminal and run in the background."""
+def daemonize() -> bool:
+    """
+    Detach the process from the terminal and run in the background.
+
+    Returns True in the daemon and False in the original process, which
+    can then wait for the daemon to come up.
+    """
     # First fork
-    if os.fork() > 0:
-        sys.exit(0)
+    pid = os.fork()
+    if pid > 0:
+        # reap the intermediate child, which exits right after the second fork
+        os.waitpid(pid, 0)
+        return False
 
     os.setsid()
 
@@ -40,17 +58,43 @@ def daemonize():
         os.dup2(f.fileno(), sys.stdout.fileno())
         os.dup2(f.fileno(), sys.stderr.fileno())
 
+    return True
+
+
+class _FastSink:
+    """
+    Minimal text sink for capturing a run's output.
+
+    Appends each write to a list and joins once in getvalue(), avoiding
+    StringIO's per-write buffer resizing for verbose runs.
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self):
+        self._parts: list[str] = []
+
+    def write(self, text: str) -> int:
+        self._parts.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
 
-def handle_request(request: dict) -> tuple[str, bool]:
+    def getvalue(self) -> str:
+        return "".join(self._parts)
+
+
+def handle_request(request: dict) -> tuple[bytes, bool]:
     """
-    Returns a Tuple: (JSON_Response_String, Should_Stop_Boolean)
+    Returns a Tuple: (Encoded_JSON_Response, Should_Stop_Boolean)
     """
     action: str | None = request.get("action", None)
     should_stop = False
     if action == "run":
         error = None
         success = False
-        capture = io.StringIO()
+        capture = _FastSink()
         params = request.get("payload", {})
         with contextlib.redirect_stdout(capture), contextlib.redirect_stderr(capture):
             try:
@@ -94,84 +138,172 @@ def handle_request(request: dict) -> tuple[str, bool]:
     return response, should_stop
 
 
+# How long an in-flight request may keep running after SIGTERM/SIGINT
+_GRACE_SECONDS = 15
+
+
+class _Shutdown(BaseException):
+    """
+    Raised from a signal handler to leave the server loop.
+
+    Like KeyboardInterrupt it derives from BaseException, so the
+    `except Exception` handlers inside a running request cannot swallow it.
+    """
+
+
 def server_start(debug: bool = False):
     # if debug is enabled then keep the server running in the terminal
-    if os.path.exists(SOCKET_FILE):
+    if not ABSTRACT_SOCKET and os.path.exists(SOCKET_FILE):
         print("Daemon is already running.")
         return
 
-    if not debug:
-        daemonize()
+    os.makedirs(RUNTIME_DIR, mode=0o700, exist_ok=True)
+
+    # Bind before forking: if the address is taken, another daemon holds it.
+    # The bound socket is inherited by the daemon process.
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(SOCKET_FILE))
+    except OSError:
+        server.close()
+        print("Daemon is already running.")
+        return
+
+    if not debug and not daemonize():
+        # the daemon owns the listening socket now
+        server.close()
+        return
 
-    os.makedirs(RUNTIME_DIR, exist_ok=True)
     with open(PID_FILE, "w") as f:
         f.write(str(os.getpid()))
 
-    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    server.bind(str(SOCKET_FILE))
     server.listen(1)
 
+    # SIGTERM and SIGINT take the same path as a "stop" request: an idle
+    # server exits at once, a busy one finishes the current request first,
+    # within a grace period. The server is busy for as long as a client is
+    # connected, so a request that is still being read is not dropped.
+    busy = False
+    stop_requested = False
+
+    def _graceful(signum, _frame):
+        nonlocal stop_requested
+        # a busy request has stdout redirected into the client's log, so
+        # write to the daemon's own stream
+        print(
+            f"\nReceived {signal.Signals(signum).name}, stopping daemon",
+            file=sys.__stdout__,
+        )
+        if not busy:
+            raise _Shutdown
+        stop_requested = True
+        signal.alarm(_GRACE_SECONDS)
+
+    def _grace_expired(_signum, _frame):
+        print(
+            f"{AC.WARNING}Request did not finish in time, exiting.{AC.RESET}",
+            file=sys.__stdout__,
+        )
+        raise _Shutdown
+
+    signal.signal(signal.SIGTERM, _graceful)
+    signal.signal(signal.SIGINT, _graceful)
+    signal.signal(signal.SIGALRM, _grace_expired)
+
     print("Waiting for connection...")
+    should_stop = False
     try:
-        while True:
+        while not should_stop:
             conn, _ = server.accept()
+
+            # the kernel reports the peer's credentials, so only processes
+            # of the user who started the daemon may drive it
+            peer_uid = peer_uid_of(conn)
+            if peer_uid is not None and peer_uid != os.getuid():
+                print(f"{AC.WARNING}Rejected connection from uid {peer_uid}{AC.RESET}")
+                conn.close()
+                continue
             print("Connection established")
 
-            with conn.makefile("r", encoding="utf-8") as stream:
-                print("Waiting for data...")
+            busy = True
+            with conn:
+                # a client may send several requests over one connection;
+                # an empty read means it has closed its end
+                while not should_stop:
+                    print("Waiting for data...")
+
+                    # blocks until a complete length-prefixed message has arrived
+                    raw_request = read_message(conn)
+                    if not raw_request:
+                        print("Connection closed by client.")
+                        break
+
+                    try:
+                        request = decode_message(raw_request)
+                        print(
+                            f"{AC.INFO}Request from client:{AC.RESET} \n"
+                            f"{json.dumps(request, indent=4)}\n"
+                        )
 
-                # readline() will freeze here until it sees a '\n' character.
-                raw_request = stream.readline()
-                if not raw_request:
-                    print(f"{AC.WARNING}Server sent empty response.{AC.RESET}")
+                        response, should_stop = handle_request(request)
 
-                try:
-                    request = json.loads(raw_request)
-                    print(
-                        f"{AC.INFO}Request from client:{AC.RESET} \n"
-                        f"{json.dumps(request, indent=4)}\n"
-                    )
+                        # Pretty-print the response for the server log
+                        try:
+                            response_dict = decode_message(response[HEADER_SIZE:])
+                            print(
+                                f"{AC.INFO}Response to client:{AC.RESET} \n"
+                                f"{json.dumps(response_dict, indent=4)}\n"
+                            )
+                        except json.JSONDecodeError:
+                            # If for some reason the response isn't valid JSON, print it raw.
+                            print(
+                                f"{AC.ERROR}Unexpected bad json response to client (raw): {AC.RESET}\n{response!r}\n"
+                            )
 
-                    response, should_stop = handle_request(request)
+                        conn.sendall(response)
 
-                    # Pretty-print the response for the server log
-                    try:
-                        response_dict = json.loads(response)
+                        if should_stop:
+                            print("Stop command received. Exiting loop.")
+
+                    except json.JSONDecodeError:
                         print(
-                            f"{AC.INFO}Response to client:{AC.RESET} \n"
-                            f"{json.dumps(response_dict, indent=4)}\n"
+                            f"{AC.ERROR}Bad json request from client (raw):{AC.RESET} \n{raw_request!r}\n"
                         )
-                    except json.JSONDecodeError:
-                        # If for some reason the response isn't valid JSON, print it raw.
+                        # Send raw error if JSON is bad
+                        err_resp = response_to_client(
+                            success=False,
+                            logs=f"Bad json request: {raw_request!r}",
+                            error="Invalid JSON",
+                        )
+                        conn.sendall(err_resp)
+
+                    except (BrokenPipeError, ConnectionResetError):
                         print(
-                            f"{AC.ERROR}Unexpected bad json response to client (raw): {AC.RESET}\n{response}\n"
+                            f"{AC.WARNING}Client disconnected before the response was sent.{AC.RESET}"
                         )
+                        break
 
-                    conn.sendall(response.encode("utf-8"))
+                    finally:
+                        if stop_requested:
+                            should_stop = True
 
-                    if should_stop:
-                        print("Stop command received. Exiting loop.")
-                        break
+            busy = False
+            if stop_requested:
+                should_stop = True
 
-                except json.JSONDecodeError:
-                    print(
-                        f"{AC.ERROR}Bad json request from client (raw):{AC.RESET} \n{raw_request}\n"
-                    )
-                    # Send raw error if JSON is bad
-                    err_resp = response_to_client(
-                        success=False,
-                        logs=f"Bad json request: {raw_request}",
-                        error="Invalid JSON",
-                    )
-                    conn.sendall(err_resp.encode("utf-8"))
-
-    except KeyboardInterrupt:
+    except _Shutdown:
         print("\nStoping Daemon")
 
     finally:
         # cleanup
+        signal.alarm(0)
         server.close()
-        if os.path.exists(SOCKET_FILE):
+        if not ABSTRACT_SOCKET and os.path.exists(SOCKET_FILE):
             os.remove(SOCKET_FILE)
         if os.path.exists(PID_FILE):
             os.remove(PID_FILE)
+
+    if not debug:
+        # This is the daemonized child. Exit here rather than return into
+        # the caller, which would go on to the parent's readiness check.
+        sys.exit(0)
@@ -1,5 +1,4 @@
 from .utils.logging_config import configure_logging
-from .core.engine import run_luminol
 from .cli.parser import parse_main_cli_args
 
 
@@ -19,6 +18,10 @@ def main():
     validate_only: bool = args.validate
     dry_run_only: bool = args.dry_run
 
+    # Intentional lazy load: --help and argument errors exit before the
+    # engine and the whole color pipeline are imported
+    from .core.engine import run_luminol  # pylint: disable= import-outside-toplevel
+
     run_luminol(
         image_path,
         theme_type,
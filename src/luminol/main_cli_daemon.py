@@ -1,11 +1,9 @@
 import logging
 import os
+import signal
 import sys
 import time
 
-from luminol.daemon.protocol import print_response_and_exit
-
-from .daemon.client import PID_FILE, SOCKET_FILE, send_request, run, ping, server_stop
 from .utils.logging_config import configure_logging
 from .cli.parser import parse_daemon_cli_args
 
@@ -13,21 +11,44 @@ from .cli.parser import parse_daemon_cli_args
 def stop_daemon():
     """
     Attempts to gracefully stop the daemon.
-    If that fails, falls back to cleaning up stale PID and socket files.
+
+    A daemon that answers but cannot honour the request is sent SIGTERM,
+    which takes the same graceful path. Only when nothing is listening are
+    the stale PID and socket files cleaned up.
     """
+    # Each handler imports only what it uses, keeping CLI startup light
+    from .daemon.client import send_request, server_stop  # pylint: disable= import-outside-toplevel
+    from .daemon.protocol import ABSTRACT_SOCKET, PID_FILE, SOCKET_FILE  # pylint: disable= import-outside-toplevel
+
+    def terminate_daemon() -> bool:
+        """Send SIGTERM to the PID in the PID file; True if it was delivered."""
+        try:
+            with open(PID_FILE, encoding="utf-8") as f:
+                pid = int(f.read().strip())
+            os.kill(pid, signal.SIGTERM)
+        except (OSError, ValueError):
+            return False
+        print(f"Sent SIGTERM to daemon (PID {pid}).")
+        return True
 
     def cleanup_daemon_files():
         """Forcibly removes the PID and socket files."""
         print("Daemon is not responsive. Cleaning up stale files...")
         cleaned = False
-        if os.path.exists(PID_FILE):
-            os.remove(PID_FILE)
+        try:
+            os.unlink(PID_FILE)
             print(f"Removed stale PID file: {PID_FILE}")
             cleaned = True
-        if os.path.exists(SOCKET_FILE):
-            os.remove(SOCKET_FILE)
-            print(f"Removed stale socket file: {SOCKET_FILE}")
-            cleaned = True
+        except FileNotFoundError:
+            pass
+        # an abstract socket has no file and vanishes with the daemon
+        if not ABSTRACT_SOCKET:
+            try:
+                os.unlink(SOCKET_FILE)
+                print(f"Removed stale socket file: {SOCKET_FILE}")
+                cleaned = True
+            except FileNotFoundError:
+                pass
 
         if cleaned:
             print("Cleanup complete.")
@@ -41,7 +62,9 @@ def stop_daemon():
             print("Daemon stopped successfully.")
         else:
             print(f"Error stopping daemon: {response.get('error', 'Unknown error')}")
-            cleanup_daemon_files()
+            # the daemon is alive, so let its signal handler shut it down
+            if not terminate_daemon():
+                cleanup_daemon_files()
 
     except (ConnectionRefusedError, FileNotFoundError):
         cleanup_daemon_files()
@@ -49,6 +72,8 @@ def stop_daemon():
 
 def handle_start(args):
     """Handles the 'start' command."""
+    from .daemon.client import send_request, ping  # pylint: disable= import-outside-toplevel
+
     try:
         if send_request(ping()).get("success"):
             print("Daemon is already running.")
@@ -62,18 +87,26 @@ def handle_start(args):
     print("Starting Luminol daemon...")
     server_start(debug=args.debug)
     if not args.debug:
-        time.sleep(1)  # Give daemon a moment to initialize
-        try:
-            if send_request(ping()).get("success"):
-                print("Daemon has started")
-            else:
-                print("Daemon failed to start.")
-        except (ConnectionRefusedError, FileNotFoundError):
-            logging.exception("Daemon failed to start")
+        # poll with exponential backoff instead of sleeping a fixed second;
+        # the daemon is usually reachable within a few milliseconds
+        deadline = time.monotonic() + 2.0
+        delay = 0.001
+        while time.monotonic() < deadline:
+            try:
+                if send_request(ping()).get("success"):
+                    print("Daemon has started")
+                    return
+            except (ConnectionRefusedError, FileNotFoundError):
+                pass  # not listening yet
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        logging.error("Daemon failed to start")
 
 
 def handle_ping():
     """Handles the 'ping' command."""
+    from .daemon.client import send_request, ping  # pylint: disable= import-outside-toplevel
+
     try:
         start_time = time.perf_counter()
         response = send_request(ping())
@@ -87,12 +120,15 @@ def handle_ping():
             print(f"Daemon returned an error: {response.get('error', 'Unknown error')}")
     except (ConnectionRefusedError, FileNotFoundError):
         print("Daemon is not running.")
-    except Exception:
+    except (OSError, ValueError):
         logging.exception("An unexpected error occurred")
 
 
 def handle_run(args):
     """Handles the 'run' command."""
+    from .daemon.client import send_request, run  # pylint: disable= import-outside-toplevel
+    from .daemon.protocol import print_response_and_exit  # pylint: disable= import-outside-toplevel
+
     payload = {
         "image_path": str(args.image),
         "theme_type": args.theme,
@@ -114,7 +150,7 @@ def handle_run(args):
     except (ConnectionRefusedError, FileNotFoundError):
         print("Daemon is not running. Please start it with 'lumid start'.")
         sys.exit(1)
-    except Exception:
+    except (OSError, ValueError):
         logging.exception("Failed to send command to daemon")
         sys.exit(1)
 
@@ -124,16 +160,15 @@ def main():
     args = parse_daemon_cli_args()
     configure_logging(verbose=False)
 
-    command_handlers = {
-        "start": lambda: handle_start(args),
-        "stop": stop_daemon,
-        "ping": handle_ping,
-        "run": lambda: handle_run(args),
-    }
-
-    handler = command_handlers.get(args.command)
-    if handler:
-        handler()
+    cmd = args.command
+    if cmd == "run":
+        handle_run(args)
+    elif cmd == "start":
+        handle_start(args)
+    elif cmd == "ping":
+        handle_ping()
+    elif cmd == "stop":
+        stop_daemon()
     else:
         logging.error("No command specified. Use --help to see available commands.")
         sys.exit(1)
@@ -1,9 +1,46 @@
 import logging
+import os
 from pathlib import Path
 
 from .path_utils import _expand_path
 
 
+def _write_bytes(file_path: Path, data: bytes) -> None:
+    """Create/truncate file_path and write data with raw os-level calls."""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        # a single write() normally takes everything; loop for partial writes
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+# Directories this process has already created or found. The daemon lives
+# across runs, so a directory removed in the meantime is dropped and
+# recreated when a write into it fails (see _write_into).
+_known_dirs: set[Path] = set()
+
+
+def _write_into(file_path: Path, data: bytes) -> None:
+    """Write data to file_path, creating its parent directory if needed."""
+    parent = file_path.parent
+    if parent not in _known_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _known_dirs.add(parent)
+        _write_bytes(file_path, data)
+        return
+
+    try:
+        _write_bytes(file_path, data)
+    except FileNotFoundError:
+        _known_dirs.discard(parent)
+        os.makedirs(parent, exist_ok=True)
+        _known_dirs.add(parent)
+        _write_bytes(file_path, data)
+
+
 def write_file(file_path: str | Path, content: str | list[str]) -> Path | None:
     """
     Writes content to a specified file path.
@@ -20,15 +57,14 @@ def write_file(file_path: str | Path, content: str | list[str]) -> Path | None:
     try:
         # Use the helper from path.py to expand the file path
         output_path = _expand_path(file_path)
-        # Create parent directories if they don't exist
-        output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Convert list to string if needed
         if isinstance(content, list):
             content = "\n".join(content)
 
-        # Write the content
-        output_path.write_text(content, encoding="utf-8")
+        # Write the content: encoded once, no Python-level buffering;
+        # parent directories are created on first use
+        _write_into(output_path, content.encode("utf-8"))
         logging.debug("Successfully wrote file to: %s", output_path)
         return output_path
     except IOError as e:
@@ -39,3 +75,31 @@ def write_file(file_path: str | Path, content: str | list[str]) -> Path | None:
             "An unexpected error occurred while writing to %s: %s", file_path, e
         )
         return None
+
+
+def batch_write(items: list[tuple[Path, bytes]]) -> list[Path]:
+    """
+    Write several already-encoded files in one pass.
+
+    Each distinct parent directory is created once per process, then every
+    file is opened, written with raw os-level calls and closed. Paths are used as
+    given (no '~' or variable expansion).
+    Args:
+        items (list[tuple[Path, bytes]]): (file path, content) pairs.
+    Returns:
+        list[Path]: The paths that were written successfully.
+    """
+    written: list[Path] = []
+
+    for file_path, data in items:
+        try:
+            _write_into(file_path, data)
+
+        except OSError as e:
+            logging.error("Failed to write file at %s: %s", file_path, e)
+            continue
+
+        logging.debug("Successfully wrote file to: %s", file_path)
+        written.append(file_path)
+
+    return written
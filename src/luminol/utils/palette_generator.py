@@ -1,50 +1,76 @@
-from typing import Any
+from functools import lru_cache
+import re
+from typing import Any, Callable
 
 from ..color.transformation import _transform_color
-from ..core.constants import SUPPORTED_COLOR_FORMATS
 from ..core.data_types import RGB, RGBA
 
 
-def _convert_format(color: RGB | RGBA, color_format: str) -> str:
-    """Converts a color object to the specified string format."""
-    if color_format not in SUPPORTED_COLOR_FORMATS:
+# One formatter per entry of SUPPORTED_COLOR_FORMATS. A base RGB has no alpha
+# channel, so its alpha formats are fixed to full opacity.
+_RGB_FORMATTERS: dict[str, Callable[[RGB], str]] = {
+    "hex6": lambda c: c.hex,
+    "hex6value": lambda c: c.hex[1:],  # removes the '#' by slicing
+    "hex8": lambda c: c.hex + "ff",
+    "hex8value": lambda c: c.hex[1:] + "ff",
+    "rgb": lambda c: f"rgb({c.r}, {c.g}, {c.b})",
+    "rgba": lambda c: f"rgba({c.r}, {c.g}, {c.b}, 1.0)",
+    "rgb_decimal": lambda c: f"{c.r}, {c.g}, {c.b}",
+    "rgba_decimal": lambda c: f"{c.r}, {c.g}, {c.b}, 1.0",
+}
+
+_RGBA_FORMATTERS: dict[str, Callable[[RGBA], str]] = {
+    **_RGB_FORMATTERS,
+    "hex8": lambda c: c.hex8,
+    "hex8value": lambda c: c.hex8[1:],
+    "rgba": lambda c: f"rgba({c.r}, {c.g}, {c.b}, {c.a})",
+    "rgba_decimal": lambda c: f"{c.r}, {c.g}, {c.b}, {c.a}",
+}
+
+
+def _convert_rgb(color: RGB, color_format: str) -> str:
+    """Converts an RGB color to the specified string format."""
+    fmt = _RGB_FORMATTERS.get(color_format)
+    if fmt is None:
         raise ValueError(f"{color_format} is not a supported color format.")
+    return fmt(color)
 
-    if color_format == "hex6":
-        return color.hex
-
-    if color_format == "hex6value":
-        return color.hex[1:]  # removes the '#' by slicing
 
-    if color_format == "rgb":
-        return f"rgb({color.r}, {color.g}, {color.b})"
+def _convert_rgba(color: RGBA, color_format: str) -> str:
+    """Converts an RGBA color to the specified string format."""
+    fmt = _RGBA_FORMATTERS.get(color_format)
+    if fmt is None:
+        raise ValueError(f"{color_format} is not a supported color format.")
+    return fmt(color)
 
-    if color_format == "rgb_decimal":
-        return f"{color.r}, {color.g}, {color.b}"
 
-    # Handle formats that require alpha
-    if isinstance(color, RGBA):
-        if color_format == "hex8":
-            return color.hex8
+@lru_cache(maxsize=4096, typed=True)
+def _convert_format(color: RGB | RGBA, color_format: str) -> str:
+    """
+    Converts a color object to the specified string format.
 
-        if color_format == "hex8value":
-            return color.hex8[1:]  # removes the '#' by slicing
+    Colors are hashable tuples, so results are memoized: the same palette
+    color is formatted for every app and template that uses it.
+    """
+    # the color's type is checked once here, not inside each formatter
+    if type(color) is RGBA:  # pylint: disable=unidiomatic-typecheck
+        return _convert_rgba(color, color_format)
+    return _convert_rgb(color, color_format)
 
-        if color_format == "rgba":
-            return f"rgba({color.r}, {color.g}, {color.b}, {color.a})"
-        if color_format == "rgba_decimal":
-            return f"{color.r}, {color.g}, {color.b}, {color.a}"
-    else:  # It's a base RGB, so force full opacity for alpha formats
-        if color_format == "hex8":
-            return f"{color.hex}ff"
 
-        if color_format == "hex8value":
-            return f"{color.hex}ff"[1:]  # removes the '#' by slicing
+@lru_cache(maxsize=64)
+def _syntax_template(syntax: str, *fields: str) -> str:
+    """
+    Turn syntax into a %-style template for the given placeholders.
 
-        if color_format == "rgba":
-            return f"rgba({color.r}, {color.g}, {color.b}, 1.0)"
-        if color_format == "rgba_decimal":
-            return f"{color.r}, {color.g}, {color.b}, 1.0"
+    The result is filled with a single `%` per color instead of one
+    str.replace pass per placeholder. str.format is not usable here, as
+    syntaxes routinely contain literal braces.
+    """
+    template = syntax.replace("%", "%%")
+    for field in fields:
+        template = template.replace(field, f"%({field})s")
+    return template
 
 
 def compile_color_syntax(
@@ -128,16 +154,13 @@ def compile_color_syntax(
           hex8/rgba formats include alpha
     """
     content: list = []
+    line = _syntax_template(syntax, "{color}", "{name}")
     if remap is None:
         for final_name, palette_color in named_colors.items():
             final_color: str = _convert_format(
                 color=palette_color, color_format=color_format
             )
-            # replace {color} with final_color and {name} with final_name
-            line: str = syntax.replace("{color}", final_color).replace(
-                "{name}", final_name
-            )
-            content.append(line)
+            content.append(line % {"{color}": final_color, "{name}": final_name})
         return content
 
     else:
@@ -158,11 +181,7 @@ def compile_color_syntax(
             final_color: str = _convert_format(
                 color=transformed_color, color_format=color_format
             )
-            # replace {color} with final_color and {name} with final_name
-            line: str = syntax.replace("{color}", final_color).replace(
-                "{name}", final_name
-            )
-            content.append(line)
+            content.append(line % {"{color}": final_color, "{name}": final_name})
 
     return content
 
@@ -174,17 +193,18 @@ def compile_template(
     color_format: str,
     remap: dict[str, Any] | None = None,
 ) -> str:
+    key_template = _syntax_template(syntax, "placeholder")
+    replacements: dict[str, str] = {}
     if remap is None:  # use semantic names as find key
         for col_name, color in named_colors.items():
-            find_key = syntax.replace("placeholder", col_name)
+            find_key = key_template % {"placeholder": col_name}
 
             final_color = _convert_format(color=color, color_format=color_format)
-            template = template.replace(find_key, final_color)
+            replacements[find_key] = final_color
 
-        return template
     else:  # use remap names as find key
         for final_name, params in remap.items():
-            find_key = syntax.replace("placeholder", final_name)
+            find_key = key_template % {"placeholder": final_name}
             source: str = params["source"]
             source_color: RGB = named_colors[source]
 
@@ -202,6 +222,14 @@ def compile_template(
                 color=transformed_color, color_format=color_format
             )
 
-            template = template.replace(find_key, final_color)
+            replacements[find_key] = final_color
 
+    if not replacements:
         return template
+
+    # one scan over the template for all keys; longest keys come first so
+    # that a key which is a prefix of another cannot cut it short
+    pattern = re.compile(
+        "|".join(map(re.escape, sorted(replacements, key=len, reverse=True)))
+    )
+    return pattern.sub(lambda m: replacements[m.group(0)], template)
@@ -1,30 +1,92 @@
+from functools import cache, lru_cache
 import os
 from pathlib import Path
 import logging
 import shutil
+import stat
+import time
 from datetime import datetime, timedelta
 
 
+@cache
+def _home() -> Path:
+    """The user's home directory; it does not change during a process."""
+    return Path.home()
+
+
+# Default location of each XDG base directory, relative to the home directory
+_XDG_DEFAULTS = {
+    "XDG_CONFIG_HOME": (".config",),
+    "XDG_CACHE_HOME": (".cache",),
+    "XDG_STATE_HOME": (".local", "state"),
+}
+
+
+def _xdg_dir(env_var: str) -> Path:
+    """Return $env_var (expanded) if it is set, otherwise its default under home."""
+    value = os.environ.get(env_var)
+    if value:
+        # values such as '~/.local/state' must not become a literal './~'
+        return Path(_expand_str(value))
+    return _home().joinpath(*_XDG_DEFAULTS[env_var])
+
+
+@cache
+def _home_str() -> str:
+    """_home() as a string without a trailing slash, for prefixing."""
+    return str(_home()).rstrip("/")
+
+
+@lru_cache(maxsize=64)
+def _expand_str(path: str) -> str:
+    """Expand '~' and environment variables; memoized per path string."""
+    # the common '~/...' form is joined onto the cached home directory;
+    # only '~user' needs expanduser's lookup
+    if path.startswith("~/"):
+        path = _home_str() + path[1:]
+    elif path.startswith("~"):
+        path = os.path.expanduser(path)
+
+    # expandvars only acts on '$', so plain paths skip the scan
+    if "$" in path:
+        path = os.path.expandvars(path)
+    return path
+
+
 def _expand_path(path: str | Path) -> Path:
-    path = str(path)
-    return Path(os.path.expandvars(os.path.expanduser(path))).resolve()
+    # Only the string expansion is cached: resolve() follows symlinks, whose
+    # targets may change while the daemon is running.
+    return Path(_expand_str(os.fspath(path))).resolve()
+
+
+def _stat_kind(path: str | Path) -> int:
+    """Return the S_IFMT file type of path (following symlinks), 0 if missing."""
+    try:
+        return stat.S_IFMT(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return 0
 
 
 def _validate_path(path: Path, path_type: str = "directory") -> Path:
     """Validate that a path exists and is of the correct type."""
-    if path_type == "directory" and not path.is_dir():
+    kind = _stat_kind(path)
+    if path_type == "directory" and kind != stat.S_IFDIR:
         raise NotADirectoryError(f"Path is not a directory: {path}")
 
-    if path_type == "file" and not path.is_file():
+    if path_type == "file" and kind != stat.S_IFREG:
         raise FileNotFoundError(f"Path is not a file: {path}")
 
     return path
 
 
+@cache
 def get_luminol_dir(custom_config_dir: str | None = None) -> Path:
     """
     Return the path to luminol directory.
 
+    The lookup (environment and directory checks) runs once per argument;
+    later calls return the resolved path.
+
     Priority order:
     1. Custom config directory (if provided)
     2. $XDG_CONFIG_HOME/luminol
@@ -44,23 +106,17 @@ def get_luminol_dir(custom_config_dir: str | None = None) -> Path:
         custom_path = _expand_path(custom_config_dir)
         return _validate_path(custom_path, "directory")
 
-    # Check XDG_CONFIG_HOME
-    xdg_config_home = os.getenv("XDG_CONFIG_HOME")
+    # $XDG_CONFIG_HOME/luminol first (when set), then ~/.config/luminol;
+    # one stat per candidate
+    candidates = [_home() / ".config" / "luminol"]
+    xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
     if xdg_config_home:
-        xdg_path = Path(xdg_config_home)
-        if xdg_path.is_dir():
-            luminol_path = xdg_path / "luminol"
-            if luminol_path.is_dir():
-                logging.debug("Using XDG config: %s", luminol_path)
-                return luminol_path
-
-    logging.debug("$XDG_CONFIG_HOME/luminol not found")
+        candidates.insert(0, Path(xdg_config_home) / "luminol")
 
-    # Fallback to ~/.config/luminol
-    home_config = Path.home() / ".config" / "luminol"
-    if home_config.is_dir():
-        logging.debug("Using home config: %s", home_config)
-        return home_config
+    for luminol_path in candidates:
+        if _stat_kind(luminol_path) == stat.S_IFDIR:
+            logging.debug("Using config directory: %s", luminol_path)
+            return luminol_path
 
     raise FileNotFoundError(
         "No luminol directory found. Searched:\n"
@@ -69,10 +125,14 @@ def get_luminol_dir(custom_config_dir: str | None = None) -> Path:
     )
 
 
+@cache
 def get_cache_dir(custom_cache_dir: str | None = None) -> Path:
     """
     Return the path to luminol cache directory, creating it if needed.
 
+    The directory is resolved and created once per argument; later calls
+    return the cached path.
+
     Priority order:
     1. Custom cache directory (if provided)
     2. $XDG_CACHE_HOME/luminol
@@ -90,17 +150,9 @@ def get_cache_dir(custom_cache_dir: str | None = None) -> Path:
         cache_path.mkdir(parents=True, exist_ok=True)
         return cache_path
 
-    # Check XDG_CACHE_HOME
-    xdg_cache_home = os.getenv("XDG_CACHE_HOME")
-    if xdg_cache_home:
-        xdg_path = Path(xdg_cache_home)
-        if xdg_path.is_dir():
-            cache_path = xdg_path / "luminol"
-            cache_path.mkdir(parents=True, exist_ok=True)
-            return cache_path
-
-    # Fallback to ~/.cache/luminol
-    cache_path = Path.home() / ".cache" / "luminol"
+    # $XDG_CACHE_HOME or ~/.cache; mkdir creates any missing parents, so the
+    # directory needs no separate existence check
+    cache_path = _xdg_dir("XDG_CACHE_HOME") / "luminol"
     cache_path.mkdir(parents=True, exist_ok=True)
     return cache_path
 
@@ -121,18 +173,10 @@ def get_base_log_dir(custom_log_dir: str | None = None) -> Path:
         Path to the base log directory.
     """
     if custom_log_dir is not None:
-        base_log_path = _expand_path(custom_log_dir)
+        return _expand_path(custom_log_dir)
 
-    else:
-        # Check XDG_STATE_HOME
-        xdg_state_home = os.getenv("XDG_STATE_HOME")
-        if xdg_state_home:
-            base_log_path = _expand_path(xdg_state_home) / "luminol" / "logs"
-        else:
-            # Fallback to ~/.local/state/luminol
-            base_log_path = Path.home() / ".local" / "state" / "luminol" / "logs"
-
-    return base_log_path
+    # $XDG_STATE_HOME or ~/.local/state
+    return _xdg_dir("XDG_STATE_HOME") / "luminol" / "logs"
 
 
 def get_log_dir(custom_log_dir: str | None = None) -> Path:
@@ -173,71 +217,106 @@ def clear_old_logs(days: int = 7) -> None:
     """
     Remove log directories older than a specified number of days.
 
+    The sweep runs at most once a day: a marker file in the base log
+    directory records the last cleanup, and a single stat of it skips the
+    directory scan when it is recent.
+
     Args:
         days (int): The maximum age of logs in days to keep.
     """
     base_log_path = get_base_log_dir()
+    marker = base_log_path / ".last_clean"
 
-    if not base_log_path.is_dir():
-        logging.debug("Log directory base does not exist, skipping cleanup.")
-        return
+    try:
+        if time.time() - marker.stat().st_mtime < 24 * 60 * 60:
+            logging.debug("Old logs were cleaned within the last day, skipping.")
+            return
+    except FileNotFoundError:
+        if not os.path.isdir(base_log_path):
+            logging.debug("Log directory base does not exist, skipping cleanup.")
+            return
+    except OSError:
+        pass
 
     logging.debug("Checking for logs older than %s days in %s", days, base_log_path)
     now = datetime.now()
     cutoff = timedelta(days=days)
 
-    for log_dir in base_log_path.iterdir():
-        if not log_dir.is_dir():
-            continue
+    # scandir reports each entry's type from the directory listing, so only
+    # symlinks cost an extra stat; entries are collected before any removal
+    with os.scandir(base_log_path) as entries:
+        log_dirs = [entry for entry in entries if entry.is_dir()]
 
+    for log_dir in log_dirs:
         if len(log_dir.name) != 19:
             continue  # definitely not a timestamp
 
         try:
             log_time = datetime.strptime(log_dir.name, "%Y-%m-%d_%H-%M-%S")
             if now - log_time > cutoff:
-                logging.info("Removing old log directory: %s", log_dir)
-                shutil.rmtree(log_dir)
+                logging.info("Removing old log directory: %s", log_dir.path)
+                shutil.rmtree(log_dir.path)
         except ValueError:
             # Ignore directories that don't match the timestamp format
             logging.debug(
                 "Skipping cleanup for non-timestamped directory: %s", log_dir.name
             )
         except Exception as e:
-            logging.error("Failed to remove directory %s: %s", log_dir, e)
+            logging.error("Failed to remove directory %s: %s", log_dir.path, e)
+
+    try:
+        marker.touch()
+    except OSError as e:
+        logging.debug("Could not update log cleanup marker %s: %s", marker, e)
 
 
-def clear_directory(dir_path: str | Path, preserve_dir: bool = True) -> None:
+def clear_directory(
+    dir_path: str | Path, preserve_dir: bool = True, keep: tuple[str, ...] = ()
+) -> None:
     """
     Clear a directory by removing all its contents.
 
     Args:
         dir_path: Path to the directory to clear
         preserve_dir: If True, only the contents are deleted (default: True)
+        keep: Names of top-level entries to leave in place when preserve_dir
+            is True
 
     Raises:
         Exception: If unable to clear the directory
     """
 
-    path = Path(dir_path)
+    path = os.fspath(dir_path)
     try:
-        if not path.exists():
-            # when path not found
-            logging.debug("Skipped (doesn't exist): %s", path)
-            return
-
+        # a missing directory is reported by the first call that touches it,
+        # instead of a separate exists() stat up front
         if preserve_dir:
-            for item in path.iterdir():
-                if item.is_dir():
-                    shutil.rmtree(item)
-                else:
-                    item.unlink()
+            try:
+                entries = os.scandir(path)
+            except FileNotFoundError:
+                logging.debug("Skipped (doesn't exist): %s", path)
+                return
+
+            # scandir entries carry their file type, so no extra stat per entry;
+            # symlinks are unlinked rather than followed
+            with entries:
+                for entry in entries:
+                    if entry.name in keep:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
 
             logging.debug("Cleared contents of: %s", path)
             return
 
         # when preserve_dir is false
-        shutil.rmtree(path)
+        try:
+            shutil.rmtree(path)
+        except FileNotFoundError:
+            logging.debug("Skipped (doesn't exist): %s", path)
+            return
         logging.debug("Removed: %s", path)
         return
 
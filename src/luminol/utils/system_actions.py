@@ -1,8 +1,10 @@
 from datetime import datetime
+from functools import lru_cache
 import logging
 from pathlib import Path
 import re
 import shlex
+import shutil
 import subprocess
 
 from ..exceptions import WallpaperSetError
@@ -27,14 +29,63 @@ def _sanitize_filename(s: str, max_len: int = 40) -> str:
     return s[:max_len]
 
 
+@lru_cache(maxsize=256)
+def _split_cached(command: str) -> tuple[str, ...]:
+    """shlex.split, memoized; configured commands repeat on every theme apply."""
+    return tuple(shlex.split(command))
+
+
+# Characters that only mean something to /bin/sh (pipes, redirection,
+# expansion, globbing, job control). Quotes are left out: shlex handles them.
+_SHELL_SYNTAX = frozenset("|&;<>()$`\\*?[]{}~#!\n")
+
+# Commands run by the shell itself. Some also exist as programs on PATH (e.g.
+# cd, echo, test), but only the shell's version behaves as the user expects.
+_SHELL_BUILTINS = frozenset(
+    ". : alias bg break cd command continue echo eval exec exit export false fc fg "
+    "getopts hash jobs kill local printf pwd read readonly return set shift source "
+    "test times trap true type ulimit umask unalias unset wait".split()
+)
+
+
+def _needs_shell(command: str) -> bool:
+    """
+    Return True unless command can be exec'd directly with the same effect.
+
+    That requires no shell syntax, and a first word that is a program on
+    PATH rather than a shell builtin or a variable assignment.
+    """
+    if not _SHELL_SYNTAX.isdisjoint(command):
+        return True
+    try:
+        args = _split_cached(command)
+    except ValueError:
+        # unbalanced quotes; let the shell report it
+        return True
+    if not args:
+        return True
+    program = args[0]
+    return program in _SHELL_BUILTINS or "=" in program or not shutil.which(program)
+
+
 def _run_detached_command(
-    command: str, log_dir: str | Path | None, use_shell: bool = False
+    command: str,
+    log_dir: str | Path | None,
+    use_shell: bool = False,
+    command_args: list[str] | None = None,
 ) -> None:
     if not command:
         logging.warning("Received an empty command.")
         return
 
-    command_args_list: list = shlex.split(command)
+    # the shell does its own tokenizing, so only split for direct exec;
+    # callers that already have the argv pass it as command_args
+    if use_shell:
+        command_args_list: list = []
+    elif command_args is not None:
+        command_args_list = command_args
+    else:
+        command_args_list = list(_split_cached(command))
     logging.debug("Executing command: '%s'", command)
 
     if not log_dir:
@@ -61,16 +112,19 @@ def _run_detached_command(
         sanitized_command_name = _sanitize_filename(command)
         log_path = expanded_log_dir / f"{sanitized_command_name}.log"
 
+        now = datetime.now()
+        header = (
+            f"****[Date: {now.date()}][Time: {now.strftime('%H:%M:%S')}]****\n\n"
+            f"Command: {command}\n\n"
+            f"{'*' * 50}  Logging Started  {'*' * 50}\n\n"
+        ).encode("utf-8")
         # some reload commands might be used multiple time,
         # in order to prevent overwriting
-        # using append mode instead of write
-        with open(log_path, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"****[Date: {datetime.now().date()}]\
-                [Time: {datetime.now().strftime('%H:%M:%S')}]****\n\n"
-            )
-            log_file.write(f"Command: {command}\n\n")
-            log_file.write(f"{'*' * 50}  Logging Started  {'*' * 50}\n\n")
+        # using append mode instead of write.
+        # Unbuffered binary append: the header goes out in a single write()
+        # and nothing is left in a Python buffer when the child inherits the fd
+        with open(log_path, "ab", buffering=0) as log_file:
+            log_file.write(header)
             if use_shell is False:
                 subprocess.Popen(  # pylint: disable=consider-using-with
                     command_args_list,
@@ -128,7 +182,8 @@ def apply_wallpaper(
     Apply a wallpaper by executing the configured command.
 
     Replaces `{wallpaper_path}` in the command with the actual image path,
-    then launches it.
+    then launches it. Without a shell, the command template is tokenized
+    once and the path is substituted into the resulting arguments.
 
     Args:
         wallpaper_set_command (str): Command to set wallpaper with `{wallpaper_path}` placeholder.
@@ -145,8 +200,19 @@ def apply_wallpaper(
     logging.debug("Executing wallpaper command: %s", final_command)
 
     try:
+        command_args = None
+        if not use_shell:
+            path = str(image_path)
+            command_args = [
+                token.replace("{wallpaper_path}", path)
+                for token in _split_cached(wallpaper_set_command)
+            ]
+
         _run_detached_command(
-            command=final_command, log_dir=log_dir, use_shell=use_shell
+            command=final_command,
+            log_dir=log_dir,
+            use_shell=use_shell,
+            command_args=command_args,
         )
         truncated_command = _truncate_string(final_command)
         logging.info("Wallpaper command executed: %s", truncated_command)
@@ -165,7 +231,10 @@ def run_reload_commands(
     """
     Execute a list of reload commands sequentially.
 
-    Each command is launched as a detached, fire-and-forget process.
+    Each command is launched as a detached, fire-and-forget process, so
+    they already run concurrently. With use_shell, a command that uses no
+    shell syntax and starts with a program on PATH (not a shell builtin) is
+    still executed directly, saving a /bin/sh per command.
 
     Args:
         reload_commands (list[str]): Commands to execute.
@@ -177,10 +246,11 @@ def run_reload_commands(
         # Commands are run as detached processes ("fire-and-forget") to prevent
         # blocking commands (like 'waybar') from hanging Luminol.
         try:
-            if use_shell:
-                _run_detached_command(command=cmd, log_dir=log_dir, use_shell=True)
-            else:
-                _run_detached_command(command=cmd, log_dir=log_dir, use_shell=False)
+            _run_detached_command(
+                command=cmd,
+                log_dir=log_dir,
+                use_shell=use_shell and _needs_shell(cmd),
+            )
 
         except (OSError, ValueError, subprocess.SubprocessError) as e:
             logging.error(